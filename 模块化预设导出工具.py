@@ -1,46 +1,167 @@
 import maya.cmds as cmds
-import maya.OpenMayaUI as omui
-from PySide6 import QtWidgets, QtCore, QtGui
-import shiboken6
+import maya.api.OpenMaya as om
 import os
+import sys
 import json
+import contextlib
 
-# 配置文件路径，保存角落设置
+# 角落设置保存在QSettings中
+SETTINGS_ORG = "PivotAdjust"
+SETTINGS_APP = "ModularPresetExport"
+# 旧版JSON配置文件路径，仅用于首次迁移到QSettings
 CONFIG_FILE = os.path.expanduser("~/.maya_pivot_adjust_config.json")
 
+# 导出文件名中不能出现的命名空间和路径分隔符
+_SAFE_NAME_TRANS = str.maketrans({':': '_', '|': '_'})
+
+# Qt模块延迟到首次需要界面时再导入，批处理中只调用工具函数时不加载PySide6
+QtWidgets = QtCore = QtGui = None
+# PivotAdjustUI类在首次需要界面时才定义
+_ui_class = None
+# Maya主窗口指针在会话内不变，包装后缓存
+_main_window_cache = None
+
+# 世界空间边界框缓存：{节点路径: (世界矩阵, 边界框)}，连续点击调整角落时复用
+_bbox_cache = {}
+# 写入缓存时的撤销队列位置和当前帧，不一致说明场景已被修改
+_bbox_cache_token = None
+
+def _filter_mesh_objects(objs):
+    """筛出本身是网格或直接带有网格形状节点的物体，整批只需一次ls查询"""
+    if not objs:
+        return []
+    mesh_shapes = cmds.ls(objs, dag=True, type="mesh", long=True) or []
+    # 网格形状节点本身及其直接父节点都算作网格物体
+    mesh_paths = set(mesh_shapes) | {shape.rsplit("|", 1)[0] for shape in mesh_shapes}
+    # 逐个通过API解析完整路径，不依赖ls返回结果与输入一一对应
+    mesh_objs = []
+    obj_selection = om.MSelectionList()
+    for obj in objs:
+        try:
+            obj_selection.clear()
+            obj_selection.add(obj)
+            path = obj_selection.getDagPath(0).fullPathName()
+        except (TypeError, RuntimeError):
+            # 非DAG节点或名称已失效，不是网格物体
+            continue
+        if path in mesh_paths:
+            mesh_objs.append(obj)
+    return mesh_objs
+
+def _flush_log(messages, errors=(), action="处理"):
+    """循环结束后一次性输出日志和失败物体，避免脚本编辑器逐行重绘"""
+    messages = messages + [f"{action} {obj} 失败：{e}" for obj, e in errors]
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
+        sys.stdout.flush()
+    if errors:
+        cmds.warning(f"{len(errors)} 个物体{action}失败，详见脚本编辑器")
+
+def _selected_dag_paths(selection, errors):
+    """预先筛出选择中的DAG节点，返回[(名称, dag路径)]，非DAG选择项记入errors"""
+    dag_paths = []
+    for i in range(selection.length()):
+        obj = selection.getSelectionStrings(i)[0]
+        try:
+            dag_paths.append((obj, selection.getDagPath(i)))
+        except (TypeError, RuntimeError) as e:
+            errors.append((obj, e))
+    return dag_paths
+
+def _load_qt():
+    """导入PySide6模块，只在第一次调用时执行"""
+    global QtWidgets, QtCore, QtGui
+    if QtWidgets is None:
+        from PySide6 import QtWidgets, QtCore, QtGui
+
+def _scene_state_token():
+    """以撤销队列最新命令和当前帧标记场景状态，撤销关闭时无法判断，返回None"""
+    if not cmds.undoInfo(q=True, state=True):
+        return None
+    return cmds.undoInfo(q=True, undoName=True), cmds.currentTime(q=True)
+
+def _clear_bbox_cache():
+    """清空边界框缓存，修改几何体的操作结束后调用"""
+    global _bbox_cache_token
+    _bbox_cache.clear()
+    _bbox_cache_token = None
+
+def _sync_bbox_cache():
+    """场景状态与写入缓存时不一致则清空边界框缓存"""
+    token = _scene_state_token()
+    if token is None or token != _bbox_cache_token:
+        _clear_bbox_cache()
+
+def _mark_bbox_cache():
+    """记录当前场景状态，此后未修改场景时缓存仍然有效"""
+    global _bbox_cache_token
+    _bbox_cache_token = _scene_state_token()
+
+def _world_bounding_box(dag):
+    """返回dag节点世界空间边界框"""
+    # 通过API直接读取边界框，避免每个物体都走一次xform命令解析
+    # 变换节点的边界框位于其父空间，乘以exclusiveMatrix得到世界空间
+    bbox = om.MFnDagNode(dag).boundingBox
+    bbox.transformUsing(dag.exclusiveMatrix())
+    return bbox
+
+def _cached_world_bounding_box(dag):
+    """返回dag节点世界空间边界框，世界矩阵未变时复用缓存"""
+    path = dag.fullPathName()
+    matrix = dag.inclusiveMatrix()
+    entry = _bbox_cache.get(path)
+    if entry is not None and entry[0] == matrix:
+        return entry[1]
+    bbox = _world_bounding_box(dag)
+    _bbox_cache[path] = (matrix, bbox)
+    return bbox
+
+def _bounding_box_corner(bbox, axis_mask):
+    """返回边界框中axis_mask指定的角落"""
+    corners = (bbox.min, bbox.max)
+    return [corners[axis_mask[k]][k] for k in (0, 1, 2)]
+
 def set_pivot_to_bounding_box_corner(use_max_dict):
     """将选中物体的枢轴点移到边界框指定角落"""
-    selected_objs = cmds.ls(selection=True)
-    if not selected_objs:
+    selection = om.MGlobal.getActiveSelectionList()
+    if selection.isEmpty():
         cmds.warning("请先选择物体！")
         return
-    for obj in selected_objs:
+    # 每个轴取最小(0)还是最大(1)，循环外只算一次
+    axis_mask = [int(use_max_dict[axis]) for axis in ('X', 'Y', 'Z')]
+    _sync_bbox_cache()
+    log = []
+    errors = []
+    for obj, dag in _selected_dag_paths(selection, errors):
         try:
-            bounding_box = cmds.xform(obj, q=True, boundingBox=True, ws=True)
-            new_pivot = []
-            for axis in ['X', 'Y', 'Z']:
-                min_idx = {'X': 0, 'Y': 1, 'Z': 2}[axis]
-                max_idx = min_idx + 3
-                new_pivot.append(bounding_box[max_idx] if use_max_dict[axis] else bounding_box[min_idx])
-            cmds.xform(obj, rp=new_pivot, sp=new_pivot, ws=True)
-            print(f"{obj} 枢轴点已移至 {new_pivot}")
+            new_pivot = _bounding_box_corner(_cached_world_bounding_box(dag), axis_mask)
+            cmds.xform(dag.fullPathName(), rp=new_pivot, sp=new_pivot, ws=True)
+            log.append(f"{obj} 枢轴点已移至 {new_pivot}")
         except Exception as e:
-            print(f"处理 {obj} 失败：{e}")
+            errors.append((obj, e))
+    # 修改枢轴点不改变边界框，记录修改后的场景状态以便下次点击复用缓存
+    _mark_bbox_cache()
+    _flush_log(log, errors)
 
 def move_object_to_world_origin():
     """将选中物体的枢轴点移到世界原点 [0, 0, 0]，保持角落位置"""
-    selected_objs = cmds.ls(selection=True)
-    if not selected_objs:
+    selection = om.MGlobal.getActiveSelectionList()
+    if selection.isEmpty():
         cmds.warning("请先选择物体！")
         return
-    for obj in selected_objs:
+    log = []
+    errors = []
+    for obj, dag in _selected_dag_paths(selection, errors):
         try:
-            current_pivot = cmds.xform(obj, q=True, rp=True, ws=True)
-            move_vector = [-current_pivot[0], -current_pivot[1], -current_pivot[2]]
-            cmds.xform(obj, t=move_vector, ws=True, r=True)
-            print(f"{obj} 已移至世界原点")
+            # 通过API读取世界空间枢轴点，省去xform查询命令
+            current_pivot = om.MFnTransform(dag).rotatePivot(om.MSpace.kWorld)
+            move_vector = [-current_pivot.x, -current_pivot.y, -current_pivot.z]
+            cmds.xform(dag.fullPathName(), t=move_vector, ws=True, r=True)
+            log.append(f"{obj} 已移至世界原点")
         except Exception as e:
-            print(f"处理 {obj} 失败：{e}")
+            errors.append((obj, e))
+    _clear_bbox_cache()
+    _flush_log(log, errors)
 
 def freeze_transformations():
     """冻结选中物体的变换，重置为默认值"""
@@ -48,14 +169,60 @@ def freeze_transformations():
     if not selected_objs:
         cmds.warning("请先选择物体！")
         return
-    for obj in selected_objs:
+    # 预先筛出网格物体，循环内只处理冻结本身
+    mesh_objs = _filter_mesh_objects(selected_objs)
+    log = []
+    errors = []
+    for obj in mesh_objs:
         try:
-            if not cmds.objectType(obj, isType="mesh") and not cmds.listRelatives(obj, shapes=True, type="mesh"):
-                continue
             cmds.makeIdentity(obj, apply=True, translate=True, rotate=True, scale=True, normal=False)
-            print(f"{obj} 变换已冻结")
+            log.append(f"{obj} 变换已冻结")
         except Exception as e:
-            print(f"冻结 {obj} 失败：{e}")
+            errors.append((obj, e))
+    _clear_bbox_cache()
+    _flush_log(log, errors, "冻结")
+
+@contextlib.contextmanager
+def _suspend_scene_updates():
+    """批量编辑期间暂停视口刷新和并行求值，所有修改合并为一个撤销块"""
+    eval_mode = cmds.evaluationManager(q=True, mode=True)[0]
+    cmds.evaluationManager(mode="off")
+    cmds.refresh(suspend=True)
+    cmds.undoInfo(openChunk=True)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
+        cmds.refresh(suspend=False)
+        cmds.evaluationManager(mode=eval_mode)
+        cmds.refresh()
+
+def prepare_for_export(use_max_dict):
+    """一次遍历完成导出前处理：枢轴点移到边界框角落、移到世界原点、冻结变换"""
+    selection = om.MGlobal.getActiveSelectionList()
+    if selection.isEmpty():
+        cmds.warning("请先选择物体！")
+        return
+    axis_mask = [int(use_max_dict[axis]) for axis in ('X', 'Y', 'Z')]
+    log = []
+    errors = []
+    dag_paths = _selected_dag_paths(selection, errors)
+    mesh_paths = set(_filter_mesh_objects([dag.fullPathName() for _, dag in dag_paths]))
+    with _suspend_scene_updates():
+        for obj, dag in dag_paths:
+            try:
+                path = dag.fullPathName()
+                # 本次处理会移动并冻结物体，边界框直接计算，不经过缓存
+                corner = _bounding_box_corner(_world_bounding_box(dag), axis_mask)
+                cmds.xform(path, rp=corner, sp=corner, ws=True)
+                cmds.xform(path, t=[-corner[0], -corner[1], -corner[2]], ws=True, r=True)
+                if path in mesh_paths:
+                    cmds.makeIdentity(path, apply=True, translate=True, rotate=True, scale=True, normal=False)
+                log.append(f"{obj} 已完成导出前处理")
+            except Exception as e:
+                errors.append((obj, e))
+    _clear_bbox_cache()
+    _flush_log(log, errors)
 
 def export_fbx_to_path(freeze_before_export=True, scale_factor=1.0):
     """将选中物体单独导出为FBX文件，以厘米为单位"""
@@ -71,6 +238,7 @@ def export_fbx_to_path(freeze_before_export=True, scale_factor=1.0):
             cmds.error(f"加载FBX插件失败：{e}")
             return
 
+    _load_qt()
     export_path = QtWidgets.QFileDialog.getExistingDirectory(None, "选择导出路径", os.path.expanduser("~"))
     if not export_path:
         cmds.warning("未选择导出路径！")
@@ -79,134 +247,213 @@ def export_fbx_to_path(freeze_before_export=True, scale_factor=1.0):
         cmds.warning(f"路径 {export_path} 不可写！")
         return
 
-    original_selection = cmds.ls(selection=True)
-    for obj in selected_objs:
+    # FBX导出设置对所有物体相同，循环前只配置一次
+    cmds.FBXResetExport()
+    try:
+        cmds.FBXExportConvertUnitString("-v", "cm")
+    except AttributeError:
+        print("警告：需手动设置FBX单位为厘米")
+    # 预先筛出网格物体，循环内只处理导出本身
+    mesh_objs = _filter_mesh_objects(selected_objs)
+
+    # 通过API切换选择，整个循环结束后只恢复一次原选择
+    original_selection = om.MGlobal.getActiveSelectionList()
+    export_selection = om.MSelectionList()
+    log = []
+    errors = []
+    # 未冻结时导出后需要还原的原始缩放
+    scaled_objs = []
+    with _suspend_scene_updates():
         try:
-            if not cmds.objectType(obj, isType="mesh") and not cmds.listRelatives(obj, shapes=True, type="mesh"):
-                continue
-            cmds.select(obj, r=True)
-            if scale_factor != 1.0:
-                cmds.scale(scale_factor, scale_factor, scale_factor, obj, relative=True)
-            if freeze_before_export:
-                cmds.makeIdentity(obj, apply=True, translate=True, rotate=True, scale=True, normal=False)
-            safe_obj_name = obj.replace(":", "_").replace("|", "_")
-            fbx_file = os.path.join(export_path, f"{safe_obj_name}.fbx")
-            cmds.FBXResetExport()
-            try:
-                cmds.FBXExportConvertUnitString("-v", "cm")
-            except AttributeError:
-                print("警告：需手动设置FBX单位为厘米")
-            cmds.FBXExport("-f", fbx_file, "-s")
-            print(f"{obj} 已导出为 {fbx_file}")
-        except Exception as e:
-            print(f"导出 {obj} 失败：{e}")
+            # 先集中完成所有场景修改，再连续导出，FBX设置在整个过程中复用
+            export_jobs = []
+            for obj in mesh_objs:
+                try:
+                    if scale_factor != 1.0:
+                        orig_scale = cmds.getAttr(obj + ".scale")[0]
+                        cmds.setAttr(obj + ".scale", *[value * scale_factor for value in orig_scale], type="double3")
+                        if not freeze_before_export:
+                            scaled_objs.append((obj, orig_scale))
+                    if freeze_before_export:
+                        cmds.makeIdentity(obj, apply=True, translate=True, rotate=True, scale=True, normal=False)
+                    safe_obj_name = obj.translate(_SAFE_NAME_TRANS)
+                    export_jobs.append((obj, os.path.join(export_path, f"{safe_obj_name}.fbx")))
+                except Exception as e:
+                    errors.append((obj, e))
+            for obj, fbx_file in export_jobs:
+                try:
+                    export_selection.clear()
+                    export_selection.add(obj)
+                    om.MGlobal.setActiveSelectionList(export_selection)
+                    cmds.FBXExport("-f", fbx_file, "-s")
+                    log.append(f"{obj} 已导出为 {fbx_file}")
+                except Exception as e:
+                    errors.append((obj, e))
         finally:
-            cmds.select(original_selection, r=True)
-
-class PivotAdjustUI(QtWidgets.QDialog):
-    """模块化预设导出工具UI"""
-    def __init__(self):
-        super(PivotAdjustUI, self).__init__()
-        self.setWindowTitle("模块化预设导出工具")
-        self.setFixedSize(400, 320)
-        self.create_ui()
-        self.load_config()
-
-    def create_ui(self):
-        layout = QtWidgets.QVBoxLayout()
-        layout.setSpacing(10)
-        layout.setContentsMargins(15, 15, 15, 15)
-
-        font = QtGui.QFont()
-        font.setPointSize(10)
-
-        # 轴选择
-        axis_group = QtWidgets.QGroupBox("选择轴最小/最大值")
-        axis_group.setFont(font)
-        axis_layout = QtWidgets.QFormLayout()
-        self.axis_combos = {}
-        for axis in ['X', 'Y', 'Z']:
-            combo = QtWidgets.QComboBox()
-            combo.addItems(['Min', 'Max'])
-            combo.setFont(font)
-            self.axis_combos[axis] = combo
-            axis_layout.addRow(f"{axis} 轴:", combo)
-        axis_group.setLayout(axis_layout)
-        layout.addWidget(axis_group)
-
-        # 按钮
-        apply_pivot_btn = QtWidgets.QPushButton("应用枢轴点到边界框角落")
-        apply_pivot_btn.setFont(font)
-        apply_pivot_btn.setFixedHeight(30)
-        apply_pivot_btn.clicked.connect(self.apply_pivot_to_corner)
-        layout.addWidget(apply_pivot_btn)
-
-        move_object_btn = QtWidgets.QPushButton("移动枢轴点到世界原点")
-        move_object_btn.setFont(font)
-        move_object_btn.setFixedHeight(30)
-        move_object_btn.clicked.connect(self.move_object_to_world_origin)
-        layout.addWidget(move_object_btn)
-
-        freeze_transform_btn = QtWidgets.QPushButton("冻结变换")
-        freeze_transform_btn.setFont(font)
-        freeze_transform_btn.setFixedHeight(30)
-        freeze_transform_btn.clicked.connect(self.freeze_transformations)
-        layout.addWidget(freeze_transform_btn)
-
-        export_fbx_btn = QtWidgets.QPushButton("一键导出FBX")
-        export_fbx_btn.setFont(font)
-        export_fbx_btn.setFixedHeight(30)
-        export_fbx_btn.clicked.connect(self.export_fbx_to_path)
-        layout.addWidget(export_fbx_btn)
-
-        cancel_btn = QtWidgets.QPushButton("取消")
-        cancel_btn.setFont(font)
-        cancel_btn.setFixedHeight(30)
-        cancel_btn.clicked.connect(self.close)
-        layout.addWidget(cancel_btn)
-
-        layout.addStretch()
-        self.setLayout(layout)
-
-    def apply_pivot_to_corner(self):
-        use_max_dict = {axis: combo.currentText() == 'Max' for axis, combo in self.axis_combos.items()}
-        set_pivot_to_bounding_box_corner(use_max_dict)
-        self.save_config(use_max_dict)
-
-    def move_object_to_world_origin(self):
-        move_object_to_world_origin()
-
-    def freeze_transformations(self):
-        freeze_transformations()
-
-    def export_fbx_to_path(self):
-        export_fbx_to_path(freeze_before_export=True, scale_factor=1.0)
-
-    def save_config(self, use_max_dict):
-        """保存角落设置到配置文件"""
-        try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(use_max_dict, f)
-        except Exception as e:
-            print(f"保存配置失败：{e}")
+            for obj, orig_scale in scaled_objs:
+                cmds.setAttr(obj + ".scale", *orig_scale, type="double3")
+            om.MGlobal.setActiveSelectionList(original_selection)
+    _clear_bbox_cache()
+    _flush_log(log, errors, "导出")
+
+def _get_ui_class():
+    """导入Qt并定义PivotAdjustUI类，只在第一次调用时执行"""
+    global _ui_class
+    if _ui_class is not None:
+        return _ui_class
+    _load_qt()
+
+    class PivotAdjustUI(QtWidgets.QDialog):
+        """模块化预设导出工具UI"""
+        # 当前打开的窗口实例，show_ui据此关闭旧窗口
+        _instance = None
+
+        def __init__(self):
+            super(PivotAdjustUI, self).__init__()
+            PivotAdjustUI._instance = self
+            self.setWindowTitle("模块化预设导出工具")
+            self.setFixedSize(400, 360)
+            self.create_ui()
+            self.load_config()
+
+        def create_ui(self):
+            layout = QtWidgets.QVBoxLayout()
+            layout.setSpacing(10)
+            layout.setContentsMargins(15, 15, 15, 15)
+
+            font = QtGui.QFont()
+            font.setPointSize(10)
+
+            # 轴选择
+            axis_group = QtWidgets.QGroupBox("选择轴最小/最大值")
+            axis_group.setFont(font)
+            axis_layout = QtWidgets.QFormLayout()
+            self.axis_combos = {}
+            for axis in ['X', 'Y', 'Z']:
+                combo = QtWidgets.QComboBox()
+                combo.addItems(['Min', 'Max'])
+                combo.setFont(font)
+                self.axis_combos[axis] = combo
+                axis_layout.addRow(f"{axis} 轴:", combo)
+            axis_group.setLayout(axis_layout)
+            layout.addWidget(axis_group)
+
+            # 按钮
+            apply_pivot_btn = QtWidgets.QPushButton("应用枢轴点到边界框角落")
+            apply_pivot_btn.setFont(font)
+            apply_pivot_btn.setFixedHeight(30)
+            apply_pivot_btn.clicked.connect(self.apply_pivot_to_corner)
+            layout.addWidget(apply_pivot_btn)
+
+            move_object_btn = QtWidgets.QPushButton("移动枢轴点到世界原点")
+            move_object_btn.setFont(font)
+            move_object_btn.setFixedHeight(30)
+            move_object_btn.clicked.connect(self.move_object_to_world_origin)
+            layout.addWidget(move_object_btn)
+
+            freeze_transform_btn = QtWidgets.QPushButton("冻结变换")
+            freeze_transform_btn.setFont(font)
+            freeze_transform_btn.setFixedHeight(30)
+            freeze_transform_btn.clicked.connect(self.freeze_transformations)
+            layout.addWidget(freeze_transform_btn)
+
+            prepare_btn = QtWidgets.QPushButton("一键预处理（角落枢轴+归零+冻结）")
+            prepare_btn.setFont(font)
+            prepare_btn.setFixedHeight(30)
+            prepare_btn.clicked.connect(self.prepare_for_export)
+            layout.addWidget(prepare_btn)
+
+            export_fbx_btn = QtWidgets.QPushButton("一键导出FBX")
+            export_fbx_btn.setFont(font)
+            export_fbx_btn.setFixedHeight(30)
+            export_fbx_btn.clicked.connect(self.export_fbx_to_path)
+            layout.addWidget(export_fbx_btn)
+
+            cancel_btn = QtWidgets.QPushButton("取消")
+            cancel_btn.setFont(font)
+            cancel_btn.setFixedHeight(30)
+            cancel_btn.clicked.connect(self.close)
+            layout.addWidget(cancel_btn)
 
-    def load_config(self):
-        """加载角落设置"""
+            layout.addStretch()
+            self.setLayout(layout)
+
+        def apply_pivot_to_corner(self):
+            use_max_dict = self.get_use_max_dict()
+            set_pivot_to_bounding_box_corner(use_max_dict)
+            self.save_config(use_max_dict)
+
+        def move_object_to_world_origin(self):
+            move_object_to_world_origin()
+
+        def freeze_transformations(self):
+            freeze_transformations()
+
+        def prepare_for_export(self):
+            use_max_dict = self.get_use_max_dict()
+            prepare_for_export(use_max_dict)
+            self.save_config(use_max_dict)
+
+        def export_fbx_to_path(self):
+            export_fbx_to_path(freeze_before_export=True, scale_factor=1.0)
+
+        def get_use_max_dict(self):
+            """读取界面中各轴的最小/最大值选择"""
+            return {axis: combo.currentText() == 'Max' for axis, combo in self.axis_combos.items()}
+
+        def save_config(self, use_max_dict):
+            """保存角落设置到QSettings"""
+            try:
+                settings = QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP)
+                for axis, is_max in use_max_dict.items():
+                    settings.setValue(f"corner/{axis}", is_max)
+            except Exception as e:
+                print(f"保存配置失败：{e}")
+
+        def load_config(self):
+            """加载角落设置，QSettings中没有时从旧版配置文件迁移"""
+            try:
+                settings = QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP)
+                if not settings.contains("corner/X") and os.path.exists(CONFIG_FILE):
+                    with open(CONFIG_FILE, 'r') as f:
+                        self.save_config(json.load(f))
+                for axis, combo in self.axis_combos.items():
+                    is_max = settings.value(f"corner/{axis}", False, type=bool)
+                    combo.setCurrentText('Max' if is_max else 'Min')
+            except Exception as e:
+                print(f"加载配置失败：{e}")
+
+        def closeEvent(self, event):
+            if PivotAdjustUI._instance is self:
+                PivotAdjustUI._instance = None
+            super(PivotAdjustUI, self).closeEvent(event)
+
+    _ui_class = PivotAdjustUI
+    return _ui_class
+
+def __getattr__(name):
+    """模块属性PivotAdjustUI在首次访问时才定义，避免导入模块时加载Qt"""
+    if name == "PivotAdjustUI":
         try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                for axis, is_max in config.items():
-                    self.axis_combos[axis].setCurrentText('Max' if is_max else 'Min')
-        except Exception as e:
-            print(f"加载配置失败：{e}")
+            return _get_ui_class()
+        except ImportError as e:
+            raise AttributeError(f"PivotAdjustUI需要PySide6：{e}") from e
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_maya_main_window():
-    """获取Maya主窗口"""
+    """获取Maya主窗口，包装结果在会话内缓存"""
+    global _main_window_cache
+    import shiboken6
+    if _main_window_cache is not None and shiboken6.isValid(_main_window_cache):
+        return _main_window_cache
+    import maya.OpenMayaUI as omui
+    _load_qt()
     main_window_ptr = omui.MQtUtil.mainWindow()
     if main_window_ptr:
-        return shiboken6.wrapInstance(int(main_window_ptr), QtWidgets.QWidget)
-    return None
+        _main_window_cache = shiboken6.wrapInstance(int(main_window_ptr), QtWidgets.QWidget)
+    else:
+        _main_window_cache = None
+    return _main_window_cache
 
 def show_ui():
     """显示UI窗口"""
@@ -214,10 +461,11 @@ def show_ui():
     if not parent:
         cmds.error("无法找到Maya主窗口！")
         return
-    for widget in QtWidgets.QApplication.allWidgets():
-        if isinstance(widget, PivotAdjustUI):
-            widget.close()
-    ui = PivotAdjustUI()
+    import shiboken6
+    ui_class = _get_ui_class()
+    if ui_class._instance is not None and shiboken6.isValid(ui_class._instance):
+        ui_class._instance.close()
+    ui = ui_class()
     ui.setParent(parent, QtCore.Qt.Window)
     ui.show()
 